@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Python APRS Module Frame Tokenizer."""
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'
+__copyright__ = 'Copyright 2016 Orion Labs, Inc. and Contributors'
+__license__ = 'Apache License, Version 2.0'
+
+
+def _find_frame_bounds(buf):
+    """
+    Locates the `>` and `:` delimiters of an APRS frame.
+
+    :param buf: Raw ASCII-Encoded APRS frame.
+    :type buf: bytes
+
+    :returns: Indices of `>` and `:`, either -1 if not found.
+    :rtype: tuple
+    """
+    gt_idx = buf.find(b'>')
+    if gt_idx < 0:
+        return -1, -1
+    return gt_idx, buf.find(b':', gt_idx + 1)
+
+
+try:
+    import numba
+
+    # At firehose rates the tokenizer dominates; the JIT kernel scans
+    # the raw bytes natively without allocating Python string objects.
+    @numba.njit(cache=True)
+    def find_frame_bounds(buf):  # pragma: no cover
+        """JIT-compiled delimiter scan, see `_find_frame_bounds`."""
+        gt_idx = -1
+        for idx in range(len(buf)):
+            char = buf[idx]
+            if gt_idx < 0:
+                if char == 62:  # b'>'
+                    gt_idx = idx
+            elif char == 58:  # b':'
+                return gt_idx, idx
+        return gt_idx, -1
+except ImportError:
+    find_frame_bounds = _find_frame_bounds
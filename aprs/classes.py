@@ -3,9 +3,12 @@
 
 """Python APRS Module Class Definitions."""
 
+import binascii
+import functools
 import itertools
 import logging
 import logging.handlers
+import selectors
 import socket
 import time
 
@@ -13,24 +16,37 @@ import pkg_resources
 import requests
 
 import aprs
+from aprs._parse import find_frame_bounds
 
 __author__ = 'Greg Albrecht W2GMD <oss@undef.net>'
 __copyright__ = 'Copyright 2016 Orion Labs, Inc. and Contributors'
 __license__ = 'Apache License, Version 2.0'
 
 
+# Deletes whitespace from a callsign in a single C-level pass.
+_CALLSIGN_STRIP = str.maketrans('', '', ' \t\r\n')
+
+
+def _get_logger():
+    """
+    Returns the module logger, installing its console handler once.
+    """
+    logger = logging.getLogger(__name__)
+    if not logger.handlers:
+        logger.setLevel(aprs.LOG_LEVEL)
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(aprs.LOG_LEVEL)
+        console_handler.setFormatter(aprs.LOG_FORMAT)
+        logger.addHandler(console_handler)
+        logger.propagate = False
+    return logger
+
+
 class APRS(object):
 
     """APRS Object."""
 
-    _logger = logging.getLogger(__name__)
-    if not _logger.handlers:
-        _logger.setLevel(aprs.LOG_LEVEL)
-        _console_handler = logging.StreamHandler()
-        _console_handler.setLevel(aprs.LOG_LEVEL)
-        _console_handler.setFormatter(aprs.LOG_FORMAT)
-        _logger.addHandler(_console_handler)
-        _logger.propagate = False
+    _logger = _get_logger()
 
     def __init__(self, user, password='-1'):
         self.user = user
@@ -79,20 +95,13 @@ class Frame(object):
 
     __slots__ = ['frame', 'source', 'destination', 'path', 'text']
 
-    _logger = logging.getLogger(__name__)
-    if not _logger.handlers:
-        _logger.setLevel(aprs.LOG_LEVEL)
-        _console_handler = logging.StreamHandler()
-        _console_handler.setLevel(aprs.LOG_LEVEL)
-        _console_handler.setFormatter(aprs.LOG_FORMAT)
-        _logger.addHandler(_console_handler)
-        _logger.propagate = False
+    _logger = _get_logger()
 
     def __init__(self, frame=None):
         self.source = ''
         self.destination = 'APRS'
         self.path = []
-        self.text = ''
+        self.text = b''
         if frame is not None:
             self.frame = frame
             self.parse()
@@ -100,18 +109,29 @@ class Frame(object):
     def __repr__(self):
         full_path = [str(self.destination)]
         full_path.extend([str(p) for p in self.path])
-        frame = "%s>%s:%s" % (
-            self.source,
-            ','.join(full_path),
-            self.text
-        )
-        return frame.encode('UTF-8')
+        return f"{self.source}>{','.join(full_path)}:{self.text_str}"
 
     def to_h(self):
         """
         Returns an Frame as a Hex String.
         """
-        return str(self).encode('hex')
+        return binascii.hexlify(str(self).encode('ascii'))
+
+    def copy(self):
+        """
+        Returns a copy of this Frame.
+
+        Pooled Frames handed to receive callbacks are recycled once the
+        callback returns; callbacks that retain a Frame past return must
+        copy it first. Callsigns are immutable and stay shared.
+        """
+        frame = Frame()
+        frame.frame = self.frame
+        frame.source = self.source
+        frame.destination = self.destination
+        frame.path = list(self.path)
+        frame.text = self.text
+        return frame
 
     def parse(self, frame=None):
         """
@@ -121,44 +141,46 @@ class Frame(object):
         if frame is not None:
             self.frame = frame
 
+        if not isinstance(self.frame, bytes):
+            self.frame = self.frame.encode('UTF-8')
+
         if not self.source or not self.destination:
             try:
                 self.parse_text()
-            except UnicodeDecodeError as exc:
-		pass	
-            #    self._logger.info(
-            #        'Cannot decode frame=%s', self.frame.encode('hex'))
-            #    self._logger.exception(exc)
+            except UnicodeDecodeError:
+                self._logger.info(
+                    'Cannot decode frame=%s', binascii.hexlify(self.frame))
 
     def parse_text(self):
         """
         Parses and Extracts the components of an ASCII-Encoded Frame.
+
+        APRS frames follow the grammar `SRC>DEST[,PATH...]:TEXT`; the
+        tokenizer in `aprs._parse` (JIT-compiled when numba is present)
+        returns the delimiter offsets and everything else is slicing.
+
+        The frame stays bytes throughout: APRS-IS traffic is ASCII per
+        spec, so only the short callsign fields are ever decoded and the
+        text payload is left for `text_str` to decode on demand.
         """
-        frame_so_far = ''
-
-        for char in self.frame.decode('UTF-8'):
-            if '>' in char and not self.source:
-                self.source = Callsign(frame_so_far)
-                frame_so_far = ''
-            elif ':' in char:
-                if not self.path:
-                    if ',' in frame_so_far:
-                        self.destination = Callsign(frame_so_far.split(',')[0])
-                        self.path = []
-                        for path in frame_so_far.split(',')[1:]:
-                            self.path.append(Callsign(path))
-                        frame_so_far = ''
-                    elif not self.destination:
-                        self.destination = Callsign(frame_so_far)
-                        frame_so_far = ''
-                    else:
-                        frame_so_far = ''.join([frame_so_far, char])
-                else:
-                    frame_so_far = ''.join([frame_so_far, char])
-            else:
-                frame_so_far = ''.join([frame_so_far, char])
+        gt_idx, colon_idx = find_frame_bounds(self.frame)
+        if gt_idx < 0 or colon_idx < 0:
+            return
+
+        self.source = _make_callsign(self.frame[:gt_idx])
+
+        full_path = self.frame[gt_idx + 1:colon_idx].split(b',')
+        self.destination = _make_callsign(full_path[0])
+        self.path = [_make_callsign(path) for path in full_path[1:]]
 
-        self.text = frame_so_far.encode('UTF-8')
+        self.text = self.frame[colon_idx + 1:]
+
+    @property
+    def text_str(self):
+        """
+        Returns the text payload decoded to str.
+        """
+        return self.text.decode('UTF-8')
 
 
 class Callsign(object):
@@ -168,24 +190,26 @@ class Callsign(object):
     Defines parts of a Callsign decoded from either ASCII or KISS.
     """
 
-    _logger = logging.getLogger(__name__)
-    if not _logger.handlers:
-        _logger.setLevel(aprs.LOG_LEVEL)
-        _console_handler = logging.StreamHandler()
-        _console_handler.setLevel(aprs.LOG_LEVEL)
-        _console_handler.setFormatter(aprs.LOG_FORMAT)
-        _logger.addHandler(_console_handler)
-        _logger.propagate = False
+    _logger = _get_logger()
 
-    __slots__ = ['callsign', 'ssid', 'digi']
+    __slots__ = ['callsign', 'ssid', 'digi', '_repr']
 
     def __init__(self, callsign):
         self.callsign = ''
         self.ssid = str(0)
         self.digi = False
+        self._repr = ''
         self.parse(callsign)
 
     def __repr__(self):
+        # Computed once at parse time - Callsigns are immutable after
+        # construction and Frame.__repr__ reprs every path element.
+        return self._repr
+
+    def _build_repr(self):
+        """
+        Builds the canonical `CALLSIGN[-SSID][*]` form of this Callsign.
+        """
         call_repr = self.callsign
 
         try:
@@ -204,12 +228,17 @@ class Callsign(object):
         """
         Returns a Callsign as a Hex String.
         """
-        return str(self).encode('hex')
+        return binascii.hexlify(str(self).encode('ascii'))
 
     def parse(self, callsign):
         """
         Parse and extract the components of a Callsign from ASCII or KISS.
         """
+        # Callsigns are the only frame fields ever decoded; ~9 chars
+        # each versus decoding the entire line.
+        if isinstance(callsign, bytes):
+            callsign = callsign.decode('UTF-8')
+
 #        try:
 #            self._extract_kiss_callsign(callsign)
 #        except IndexError:
@@ -218,6 +247,8 @@ class Callsign(object):
         if not aprs.valid_callsign(self.callsign):
             self.parse_text(callsign)
 
+        self._repr = self._build_repr()
+
 #        if not aprs.valid_callsign(self.callsign):
 #            raise aprs.BadCallsignError(
 #                'Could not extract callsign from %s',
@@ -231,19 +262,35 @@ class Callsign(object):
         :param callsign: ASCII-Encoded APRS Callsign
         :type callsign: str
         """
-        self._logger.debug('<pt> callsign=%s', callsign)
-        _callsign = callsign.lstrip().rstrip()
-        ssid = str(0)
+        _callsign = callsign.translate(_CALLSIGN_STRIP)
 
-        if '*' in _callsign:
-            _callsign = _callsign.strip('*')
-            self.digi = True
+        self.digi = _callsign.endswith('*')
+        if self.digi:
+            _callsign = _callsign.rstrip('*')
 
-        if '-' in _callsign:
-            _callsign, ssid = _callsign.split('-')
+        self.callsign, _, ssid = _callsign.partition('-')
+        self.ssid = ssid or str(0)
 
-        self.callsign = _callsign
-        self.ssid = ssid.lstrip().rstrip()
+
+def _frame_to_bytes(frame):
+    """
+    Returns a frame rendered as bytes, encoding str input once.
+    """
+    if isinstance(frame, bytes):
+        return frame
+    return str(frame).encode('UTF-8')
+
+
+@functools.lru_cache(maxsize=4096)
+def _make_callsign(callsign):
+    """
+    Returns a cached Callsign for a raw callsign string.
+
+    APRS-IS traffic repeats the same callsigns (WIDE1-1, WIDE2-1, beacon
+    sources) constantly, so interning turns re-parses into dict lookups.
+    Cached instances are shared and must not be mutated after parse.
+    """
+    return Callsign(callsign)
 
 
 class TCP(APRS):
@@ -256,11 +303,37 @@ class TCP(APRS):
         aprs_filter = aprs_filter or '/'.join(['p', user])
 
         self._full_auth = ' '.join([self._auth, 'filter', aprs_filter])
+        # Login line is rendered to bytes once; sends only append CRLF.
+        self._full_auth_bytes = (self._full_auth + '\r\n').encode('UTF-8')
 
         self.servers = itertools.cycle(servers)
         self.use_i_construct = True
         self._connected = False
 
+        # Frames handed to the receive callback are recycled from this
+        # ring, so the steady state allocates nothing per line.
+        self._frame_pool = [Frame() for _ in range(256)]
+        self._frame_cursor = 0
+
+    def _get_frame(self, line):
+        """
+        Parses line into a recycled Frame from the pool.
+
+        The returned Frame is only valid until the receive callback
+        returns; see `Frame.copy`.
+        """
+        frame = self._frame_pool[self._frame_cursor]
+        self._frame_cursor = (
+            self._frame_cursor + 1) % len(self._frame_pool)
+
+        frame.source = ''
+        frame.destination = 'APRS'
+        frame.path = []
+        frame.text = b''
+        frame.parse(line)
+
+        return frame
+
     def start(self):
         """
         Connects & logs in to APRS-IS.
@@ -293,12 +366,22 @@ class TCP(APRS):
                 # Auth
                 self._logger.info(
                     "Auth To %s:%i", addr_info[0][4][0], port)
-                self.interface.sendall(self._full_auth + '\n\r')
+                self.interface.sendall(self._full_auth_bytes)
 
                 server_return = self.interface.recv(1024)
                 self._logger.info(
                     'Auth Result "%s"', server_return.rstrip())
 
+                # Keepalive detects stalled links under packet loss;
+                # non-blocking mode lets receive() wait on a selector
+                # instead of stalling in recv.
+                self.interface.setsockopt(
+                    socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                if hasattr(socket, 'TCP_KEEPIDLE'):
+                    self.interface.setsockopt(
+                        socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30)
+                self.interface.setblocking(False)
+
                 self._connected = True
             except socket.error as ex:
                 self._logger.warn(
@@ -314,55 +397,96 @@ class TCP(APRS):
         :type frame: str
         """
         self._logger.info('Sending frame="%s"', frame)
-        return self.interface.send("%s\n\r" % frame)  # Ensure cast->str.
+        # sendmsg gathers the frame and CRLF terminator without building
+        # an intermediate string per send.
+        return self.interface.sendmsg([_frame_to_bytes(frame), b'\r\n'])
 
-    def receive(self, callback=None):
+    def receive(self, callback=None, batch_callback=None):
         """
         Receives from APRS-IS.
 
-        :param callback: Optional callback to deliver frame to.
+        :param callback: Optional callback to deliver frame to. Frames
+            are pooled and recycled after the callback returns; use
+            `Frame.copy` to retain one.
         :type callback: func
+        :param batch_callback: Optional callback taking a list of
+            Frames, called once per receive batch instead of once per
+            frame. Batched Frames are freshly allocated and safe to
+            retain.
+        :type batch_callback: func
 
         :returns: Nothing, but calls a callback with an Frame object.
         :rtype: None
         """
-        recvd_data = ''
+        # One recv buffer is allocated up front and filled in place with
+        # recv_into; accumulation stays in a bytearray so neither step
+        # re-copies the whole buffer the way str += did.
+        recv_buffer = bytearray(aprs.RECV_BUFFER)
+        recv_view = memoryview(recv_buffer)
+        recvd_data = bytearray()
+
+        selector = selectors.DefaultSelector()
+        selector.register(self.interface, selectors.EVENT_READ)
 
         try:
             while 1:
-                recv_data = self.interface.recv(aprs.RECV_BUFFER)
-
-                if not recv_data:
-                    break
-
-                recvd_data += recv_data
-
-                self._logger.debug('recv_data=%s', recv_data.strip())
-
-                if recvd_data.endswith('\r\n'):
-                    lines = recvd_data.strip().split('\r\n')
-                    recvd_data = ''
+                if not selector.select(timeout=1):
+                    continue
+
+                try:
+                    recv_length = self.interface.recv_into(recv_view)
+                except (BlockingIOError, InterruptedError):
+                    continue
+
+                recvd_data.extend(recv_view[:recv_length])
+
+                self._logger.debug('recv_length=%s', recv_length)
+
+                # Keep buffering while the server has more queued and
+                # the high-water mark is not reached, so a single split
+                # yields a large batch of lines per pass. On EOF, fall
+                # through so buffered lines are still delivered.
+                if (recv_length and
+                        len(recvd_data) < aprs.RECV_HIGH_WATER and
+                        selector.select(timeout=0)):
+                    continue
+
+                lines = bytes(recvd_data).split(b'\r\n')
+                recvd_data = bytearray(lines.pop())
+
+                if batch_callback:
+                    # One Python-level call per recv batch. A batch can
+                    # outnumber the frame pool, so these Frames are
+                    # freshly allocated rather than pooled.
+                    frames = [Frame(line) for line in lines
+                              if line and line[:1] != b'#']
+                    if frames:
+                        batch_callback(frames)
                 else:
-                    lines = recvd_data.split('\r\n')
-                    recvd_data = str(lines.pop(-1))
-
-                for line in lines:
-                    if line.startswith('#'):
-                        if 'logresp' in line:
-                            self._logger.debug('logresp=%s', line)
-                    else:
+                    for line in lines:
+                        # Server comments are a large share of the
+                        # stream; a one-byte compare skips them before
+                        # any decode or Frame construction happens.
+                        if line[:1] == b'#':
+                            if b'logresp' in line:
+                                self._logger.debug('logresp=%s', line)
+                            continue
+
                         try:
-				line.encode('UTF-8')
-                        	self._logger.debug('line=%s', line)
-	                        if callback:
-        	                    callback(Frame(line))
-			except:
-				pass
+                            self._logger.debug('line=%s', line)
+                            if callback:
+                                callback(self._get_frame(line))
+                        except:  # pylint: disable=W0702
+                            pass
+
+                if not recv_length:
+                    break
 
         except socket.error as sock_err:
             self._logger.error(sock_err)
-	    print "We are leaving"	
             raise
+        finally:
+            selector.close()
 
 
 class UDP(APRS):
@@ -374,6 +498,7 @@ class UDP(APRS):
         server = server or aprs.APRSIS_SERVERS[0]
         port = port or aprs.APRSIS_RX_PORT
         self._addr = (server, int(port))
+        self._auth_prefix = (self._auth + '\n').encode('UTF-8')
         self.use_i_construct = True
 
     def start(self):
@@ -390,7 +515,7 @@ class UDP(APRS):
         :type frame: str
         """
         self._logger.info('Sending frame="%s"', frame)
-        content = "\n".join([self._auth, str(frame)])
+        content = b''.join([self._auth_prefix, _frame_to_bytes(frame)])
         return self.interface.sendto(content, self._addr)
 
 
@@ -402,13 +527,20 @@ class HTTP(APRS):
         super(HTTP, self).__init__(user, password)
         self.url = url or aprs.APRSIS_URL
         self.headers = headers or aprs.APRSIS_HTTP_HEADERS
+        self._auth_prefix = (self._auth + '\n').encode('UTF-8')
         self.use_i_construct = True
 
     def start(self):
         """
         Connects & logs in to APRS-IS.
         """
-        self.interface = requests.post
+        # A Session keeps the TCP (and TLS) connection alive between
+        # sends instead of paying connection setup per frame.
+        self.interface = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=4)
+        self.interface.mount('http://', adapter)
+        self.interface.mount('https://', adapter)
 
     def send(self, frame):
         """
@@ -418,8 +550,9 @@ class HTTP(APRS):
         :type frame: str
         """
         self._logger.info('Sending frame="%s"', frame)
-        content = "\n".join([self._auth, str(frame)])
-        result = self.interface(self.url, data=content, headers=self.headers)
+        content = b''.join([self._auth_prefix, _frame_to_bytes(frame)])
+        result = self.interface.post(
+            self.url, data=content, headers=self.headers)
         return result.status_code == 204
 
 
@@ -28,3 +28,7 @@ APRSIS_HTTP_HEADERS = {
 }
 
 RECV_BUFFER = 1024
+
+# Keep buffering until this many bytes (or the server runs dry) before
+# splitting out lines, so per-recv work is amortized over many frames.
+RECV_HIGH_WATER = 65536